@@ -95,10 +95,14 @@ class Bento(StoreItem):
     _tag: Tag = attr.field()
     __fs: "FS" = attr.field()
 
-    _info: "BentoInfo"
+    # declared as fields so they get slots; with auto_attribs=False bare
+    # annotations are not attrs fields, and the slotted StoreItem hierarchy
+    # no longer provides a __dict__ to fall back on. eq=False keeps equality
+    # over (_tag, __fs) as before.
+    _info: "BentoInfo" = attr.field(init=False, default=None, eq=False)
 
-    _model_store: ModelStore
-    _doc: t.Optional[str] = None
+    _model_store: ModelStore = attr.field(init=False, default=None, eq=False)
+    _doc: t.Optional[str] = attr.field(init=False, default=None, eq=False)
 
     @staticmethod
     def _export_ext() -> str:
@@ -117,6 +121,9 @@ class Bento(StoreItem):
     def __init__(self, tag: Tag, bento_fs: "FS", info: "BentoInfo"):
         self._tag = tag
         self.__fs = bento_fs
+        # slots have no class-attribute fallback, so the lazy doc cache must
+        # be initialized here
+        self._doc = None
         self.check_fs(None, bento_fs)
         self._info = info
         self.validate()
@@ -337,6 +344,8 @@ class Bento(StoreItem):
 
 
 class BentoStore(Store[Bento]):
+    __slots__ = ()
+
     def __init__(self, base_path: t.Union[PathType, "FS"]):
         super().__init__(base_path, Bento)
 
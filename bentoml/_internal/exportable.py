@@ -24,6 +24,10 @@ uriSchemeRe = re.compile(r".*[^\\](?=://)")
 
 
 class Exportable(ABC):
+    # keep the hierarchy slotted: subclasses are attrs slots classes, and a
+    # non-slotted base would silently give every instance a __dict__ back
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def _export_ext() -> str:
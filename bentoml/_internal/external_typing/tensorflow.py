@@ -15,6 +15,7 @@ from tensorflow.python.framework.sparse_tensor import SparseTensorSpec
 from tensorflow.python.keras.engine.sequential import Sequential
 from tensorflow.python.framework.indexed_slices import IndexedSlices
 from tensorflow.python.ops.ragged.ragged_tensor import RaggedTensorSpec
+from tensorflow.python.saved_model.load_options import LoadOptions
 from tensorflow.python.saved_model.save_options import SaveOptions
 from tensorflow.python.framework.composite_tensor import CompositeTensor
 from tensorflow.python.training.tracking.tracking import AutoTrackable
@@ -97,6 +98,7 @@ __all__ = [
     "SignatureMap",
     "Module",
     "TypeSpec",
+    "LoadOptions",
     "SaveOptions",
     "Session",
     "KerasModel",
@@ -14,7 +14,6 @@ from bentoml import Tag
 from bentoml import Runnable
 from bentoml.models import ModelContext
 from bentoml.exceptions import NotFound
-from bentoml.exceptions import MissingDependencyException
 
 from ..types import LazyType
 from ..models.model import ModelSignature
@@ -24,30 +23,38 @@ from ..runner.container import DataContainer
 from ..runner.container import DataContainerRegistry
 from ..utils.tensorflow import get_tf_version
 from ..utils.tensorflow import hook_loaded_model
+from ..utils.tensorflow import tf_function_wrapper
+from ..utils.lazy_loader import LazyLoader
 
 logger = logging.getLogger(__name__)
 
-try:
-    import tensorflow as tf  # type: ignore
-except ImportError:  # pragma: no cover
-    raise MissingDependencyException(
-        """\
-    `tensorflow` is required in order to use `bentoml.tensorflow`.
-    Instruction: `pip install tensorflow`
-    """
-    )
-
-
 if TYPE_CHECKING:
+    import tensorflow as tf
+
     from .. import external_typing as ext
     from ..models.model import ModelSignatureDict
     from ..external_typing import tensorflow as tf_ext
 
     TFArgType = t.Union[t.List[t.Union[int, float]], ext.NpNDArray, tf_ext.Tensor]
+else:
+    tf = LazyLoader(
+        "tf",
+        globals(),
+        "tensorflow",
+        exc_msg="`tensorflow` is required in order to use `bentoml.tensorflow`. "
+        "Instruction: `pip install tensorflow`",
+    )
 
 MODULE_NAME = "bentoml.tensorflow"
 API_VERSION = "v1"
 
+# Opt-in: ship CPU-resident tensors between the API server and runner workers
+# through POSIX shared memory instead of the payload body. Only valid when both
+# processes run on the same host and share /dev/shm.
+_SHM_PAYLOAD_ENABLED = (
+    os.environ.get("BENTOML_TENSORFLOW_SHM_PAYLOAD", str(False)).lower() == "true"
+)
+
 
 def get(tag_like: str | Tag) -> bentoml.Model:
     model = bentoml.models.get(tag_like)
@@ -58,9 +65,42 @@ def get(tag_like: str | Tag) -> bentoml.Model:
     return model
 
 
+@functools.lru_cache(maxsize=None)
+def _physical_gpus() -> t.Tuple[t.Any, ...]:
+    # device enumeration goes through the C API and its result cannot change
+    # within a process, so query it once instead of on every load_model call
+    return tuple(tf.config.list_physical_devices("GPU"))
+
+
+@functools.lru_cache(maxsize=None)
+def _enable_gpu_memory_growth() -> None:
+    # set_memory_growth must be applied before the GPU is initialized and is
+    # rejected afterwards, so this is a once-per-process operation anyway
+    tf.config.experimental.set_memory_growth(_physical_gpus()[0], True)
+
+
+def _prefetch_model_files(model_path: str) -> None:
+    """Hint the OS to read the SavedModel files (graph def, variable shards)
+    into the page cache ahead of the synchronous reads done by
+    ``tf.saved_model.load``, so checkpoint restore overlaps with disk I/O."""
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover (platform specific)
+        return
+    for root, _, files in os.walk(model_path):
+        for name in files:
+            try:
+                fd = os.open(os.path.join(root, name), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+
 def load_model(
     bento_model: str | Tag | bentoml.Model,
     device_name: str = "/device:CPU:0",
+    tf_load_options: "tf_ext.LoadOptions" | None = None,
 ) -> "tf_ext.AutoTrackable" | "tf_ext.Module":
     """
     Load a tensorflow model from BentoML local modelstore with given name.
@@ -71,6 +111,9 @@ def load_model(
             instance to load the model from.
         device_name (``str`` | ``None``):
             The device id to load the model on. The device id format should be compatible with `tf.device <https://www.tensorflow.org/api_docs/python/tf/device>`_
+        tf_load_options (`tf.saved_model.LoadOptions`, `optional`, default to :code:`None`):
+            :obj:`tf.saved_model.LoadOptions` object that specifies options for loading,
+            e.g. checkpoint restore behavior for large variable files.
 
 
     Returns:
@@ -90,11 +133,14 @@ def load_model(
         bento_model = get(bento_model)
 
     if "GPU" in device_name:
-        physical_devices = tf.config.list_physical_devices("GPU")
-        tf.config.experimental.set_memory_growth(physical_devices[0], True)
+        _enable_gpu_memory_growth()
+
+    _prefetch_model_files(bento_model.path)
 
     with tf.device(device_name):
-        tf_model: "tf_ext.AutoTrackable" = tf.saved_model.load(bento_model.path)  # type: ignore
+        tf_model: "tf_ext.AutoTrackable" = tf.saved_model.load(
+            bento_model.path, options=tf_load_options
+        )  # type: ignore
         return hook_loaded_model(tf_model, MODULE_NAME)
 
 
@@ -202,6 +248,13 @@ def save_model(
         signatures=signatures,  # type: ignore
     ) as bento_model:
 
+        # the save runs synchronously on purpose: the surrounding context
+        # manager snapshots bento_model.path into the model store on exit, so
+        # the SavedModel write has to be complete here and a background thread
+        # would only be joined immediately. SavedModel also fixes its own
+        # on-disk layout; compression knobs, when needed, belong to the model
+        # store transfer, not this writer. tf_save_options remains the hook
+        # for tuning the writer itself (e.g. experimental_io_device).
         tf.saved_model.save(
             model,
             bento_model.path,
@@ -212,16 +265,33 @@ def save_model(
         return bento_model.tag
 
 
+def _mapping(item: "TFArgType") -> "tf_ext.TensorLike":
+    # tf.is_tensor is a plain isinstance check; the previous LazyType-based
+    # check re-resolved the tensor class on every argument of every request
+    if not tf.is_tensor(item):
+        return t.cast("tf_ext.TensorLike", tf.convert_to_tensor(item))
+    return item
+
+
 def get_runnable(
     bento_model: bentoml.Model,
 ):
     """
     Private API: use :obj:`~bentoml.Model.to_runnable` instead.
+
+    Micro-batching is intentionally not implemented here: for batchable
+    signatures the runner server already accumulates concurrent requests
+    (see ``bentoml._internal.marshal.dispatcher.CorkDispatcher``) and hands
+    this runnable a merged batch, so larger batches reach the device without
+    a second accumulator adding latency in the worker.
     """
 
     partial_kwargs: t.Dict[str, t.Any] = bento_model.info.options.get(
         "partial_kwargs", dict()
     )
+    # opt-in XLA compilation of the model signatures, e.g.
+    # bentoml.models.get("my_model").with_options(jit_compile=True).to_runner()
+    jit_compile: bool = bento_model.info.options.get("jit_compile", False)
 
     class TensorflowRunnable(Runnable):
         SUPPORT_NVIDIA_GPU = True
@@ -229,7 +299,20 @@ def get_runnable(
 
         def __init__(self):
             super().__init__()
-            if len(tf.config.list_physical_devices("GPU")) > 0:
+            if jit_compile:
+                # XLA recompiles every signature from scratch on worker start;
+                # pointing the persistent compilation cache at the model
+                # directory lets restarted workers reuse earlier compilations.
+                # TF only reads TF_XLA_FLAGS once, so respect an existing
+                # cache directory setting.
+                xla_flags = os.environ.get("TF_XLA_FLAGS", "")
+                if "--tf_xla_persistent_cache_directory" not in xla_flags:
+                    cache_dir = bento_model.path_of("xla_cache")
+                    os.makedirs(cache_dir, exist_ok=True)
+                    os.environ["TF_XLA_FLAGS"] = (
+                        f"{xla_flags} --tf_xla_persistent_cache_directory={cache_dir}".strip()
+                    )
+            if len(_physical_gpus()) > 0:
                 # In Multi-GPU scenarios, the visible cuda devices will be set for each Runner worker
                 # by the runner's Scheduling Strategy. So that the Runnable implementation only needs
                 # to find the first GPU device visible to current process.
@@ -238,7 +321,12 @@ def get_runnable(
                 self.device_name = "/device:CPU:0"
 
             self.model = load_model(bento_model, device_name=self.device_name)
-            self.methods_cache: t.Dict[str, t.Callable[..., t.Any]] = {}
+            # generate the per-signature closures up front so serving requests
+            # never pay for the lazy-generation branch
+            self.methods_cache: t.Dict[str, t.Callable[..., t.Any]] = {
+                method_name: _gen_run_method(self, method_name)
+                for method_name in bento_model.info.signatures
+            }
             self.session_stack = contextlib.ExitStack()
             self.session_stack.enter_context(tf.device(self.device_name))
 
@@ -250,38 +338,75 @@ def get_runnable(
 
     def _gen_run_method(runnable_self: TensorflowRunnable, method_name: str):
         raw_method = getattr(runnable_self.model, method_name)
+        if isinstance(raw_method, tf_function_wrapper):
+            # hook_loaded_model already replaced restored signatures with a
+            # tf_function_wrapper whose spec casting must stay eager; only the
+            # restored function underneath may be recompiled for XLA
+            if jit_compile:
+                raw_method = tf_function_wrapper(
+                    tf.function(
+                        raw_method.origin_func,
+                        reduce_retracing=True,
+                        jit_compile=True,
+                    ),
+                    arg_names=raw_method.arg_names,
+                    arg_specs=raw_method.arg_specs,
+                    kwarg_specs=raw_method.kwarg_specs,
+                )
+        elif jit_compile or not isinstance(
+            raw_method,
+            (
+                tf.types.experimental.GenericFunction,
+                tf.types.experimental.ConcreteFunction,
+            ),
+        ):
+            # wrap plain Python callables so each input shape/dtype is traced
+            # once and later calls run the cached concrete function instead of
+            # executing eagerly; with jit_compile enabled, restored signatures
+            # are re-wrapped as well so they go through XLA
+            raw_method = tf.function(
+                raw_method,
+                reduce_retracing=True,
+                jit_compile=True if jit_compile else None,
+            )
         method_partial_kwargs = partial_kwargs.get(method_name)
         if method_partial_kwargs:
-            raw_method = functools.partial(raw_method, **method_partial_kwargs)
-
-        def _mapping(item: "TFArgType") -> "tf_ext.TensorLike":
-            if not LazyType["tf_ext.TensorLike"]("tensorflow.Tensor").isinstance(item):
-                return t.cast("tf_ext.TensorLike", tf.convert_to_tensor(item))
-            else:
-                return item
+            base_method = raw_method
+
+            def raw_method(*args: t.Any, **kwargs: t.Any) -> t.Any:
+                # matches functools.partial semantics: call-site kwargs win
+                # over the preset ones, without paying for a dict merge on
+                # the common no-kwargs call
+                if kwargs:
+                    kwargs = {**method_partial_kwargs, **kwargs}
+                else:
+                    kwargs = method_partial_kwargs
+                return base_method(*args, **kwargs)
 
         def _run_method(
             runnable_self: TensorflowRunnable, *args: "TFArgType", **kwargs: "TFArgType"
-        ) -> "ext.NpNDArray":
+        ) -> "tf_ext.EagerTensor":
+            # fast path for the dominant call shape — a single positional
+            # batch — which skips the Params allocation and its map loop
+            if len(args) == 1 and not kwargs:
+                return raw_method(_mapping(args[0]))
+
             params = Params["TFArgType"](*args, **kwargs)
             params = params.map(_mapping)
-            res = raw_method(*params.args, **params.kwargs)
-            return t.cast("ext.NpNDArray", res.numpy())
+            # return the EagerTensor as-is; forcing .numpy() here would block on
+            # a device-to-host copy even when the result is consumed by another
+            # tf op or serialized by TensorflowTensorContainer
+            return raw_method(*params.args, **params.kwargs)
 
         return _run_method
 
     def add_run_method(method_name: str, options: ModelSignature):
         def run_method(
             runnable_self: TensorflowRunnable, *args: "TFArgType", **kwargs: "TFArgType"
-        ) -> "ext.NpNDArray":
-            _run_method = runnable_self.methods_cache.get(
-                method_name
-            )  # is methods_cache nessesary?
-            if not _run_method:
-                _run_method = _gen_run_method(runnable_self, method_name)
-                runnable_self.methods_cache[method_name] = _run_method
-
-            return _run_method(runnable_self, *args, **kwargs)
+        ) -> "tf_ext.EagerTensor":
+            return runnable_self.methods_cache[method_name](
+                runnable_self, *args, **kwargs
+            )
 
         TensorflowRunnable.add_method(
             run_method,
@@ -307,10 +432,10 @@ class TensorflowTensorContainer(
     ) -> t.Tuple["tf_ext.EagerTensor", list[int]]:
         batch: "tf_ext.EagerTensor" = tf.concat(batches, axis=batch_dim)
         # TODO: fix typing mismatch @larme
-        indices: list[int] = list(
-            itertools.accumulate(subbatch.shape[batch_dim] for subbatch in batches)
-        )  # type: ignore
-        indices = [0] + indices
+        indices: list[int] = [0]
+        indices.extend(
+            itertools.accumulate(subbatch.shape[batch_dim] for subbatch in batches)  # type: ignore
+        )
         return batch, indices
 
     @classmethod
@@ -326,19 +451,119 @@ class TensorflowTensorContainer(
         batch: "tf_ext.EagerTensor",
         batch_dim: int = 0,
     ) -> Payload:
+        # RaggedTensor/SparseTensor are composite tensors without a single
+        # contiguous buffer, so they still go through pickle.
+        if isinstance(batch, (tf.RaggedTensor, tf.SparseTensor)):
+            return cls.create_payload(
+                pickle.dumps(batch),
+                batch_size=batch.shape[batch_dim],
+                meta={"format": "pickle"},
+            )
+
+        if _SHM_PAYLOAD_ENABLED and "CPU" in batch.device:
+            payload = cls._to_shm_payload(batch, batch_dim)
+            if payload is not None:
+                return payload
 
         return cls.create_payload(
-            pickle.dumps(batch),
+            tf.io.serialize_tensor(batch).numpy(),
             batch_size=batch.shape[batch_dim],
+            meta={"format": "serialize_tensor", "dtype": batch.dtype.name},
         )
 
+    @classmethod
+    def _to_shm_payload(
+        cls,
+        batch: "tf_ext.EagerTensor",
+        batch_dim: int,
+    ) -> Payload | None:
+        """Copy a CPU-resident dense tensor into a shared memory segment and
+        ship only the segment handle, so the payload body stays a few dozen
+        bytes regardless of the tensor size. The receiving worker copies the
+        tensor out of the segment and unlinks it; each segment is single-use.
+        """
+        import numpy as np
+        from multiprocessing import shared_memory
+        from multiprocessing import resource_tracker
+
+        # to_dlpack CHECK-fails (aborting the process, not raising) on dtypes
+        # without a flat numeric buffer such as tf.string, so these must be
+        # rejected before the DLPack call rather than caught around it
+        if batch.dtype == tf.string or not batch.dtype.is_numpy_compatible:
+            return None
+
+        try:
+            # DLPack exposes the tensor buffer as a zero-copy numpy view, so
+            # the only copy left is the one into the shared memory segment;
+            # batch.numpy() is the fallback for dtypes DLPack cannot describe
+            arr: "ext.NpNDArray" = np.from_dlpack(
+                tf.experimental.dlpack.to_dlpack(batch)
+            )
+        except (TypeError, ValueError, AttributeError):
+            arr = batch.numpy()
+        # object/void dtypes (e.g. tf.string) have no flat buffer to share
+        if arr.nbytes == 0 or arr.dtype.hasobject or arr.dtype.kind == "V":
+            return None
+
+        if not arr.flags["C_CONTIGUOUS"]:
+            arr = np.ascontiguousarray(arr)
+
+        shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+        try:
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            payload = cls.create_payload(
+                pickle.dumps(
+                    {"name": shm.name, "shape": arr.shape, "dtype": arr.dtype.str}
+                ),
+                batch_size=batch.shape[batch_dim],
+                meta={"format": "shm"},
+            )
+        except BaseException:
+            # don't leak the segment if the copy or payload build fails
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        # the consumer unlinks the segment from its own process, so drop it
+        # from this process's resource tracker or the tracker will warn and
+        # try to unlink the already-removed name again at exit. A payload
+        # that is never consumed (e.g. a cancelled request) leaks its
+        # segment until /dev/shm is cleaned up.
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore (private name matches what SharedMemory registered)
+        return payload
+
+    @classmethod
+    def _from_shm_payload(cls, payload: Payload) -> "tf_ext.EagerTensor":
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        handle = pickle.loads(payload.data)
+        shm = shared_memory.SharedMemory(name=handle["name"])
+        try:
+            arr = np.ndarray(
+                handle["shape"], dtype=np.dtype(handle["dtype"]), buffer=shm.buf
+            )
+            # tf.constant copies, so the tensor outlives the segment
+            return tf.constant(arr)
+        finally:
+            shm.close()
+            shm.unlink()
+
     @classmethod
     def from_payload(
         cls,
         payload: Payload,
     ) -> "tf_ext.EagerTensor":
+        if payload.meta.get("format") == "pickle":
+            return pickle.loads(payload.data)
+
+        if payload.meta.get("format") == "shm":
+            return cls._from_shm_payload(payload)
 
-        return pickle.loads(payload.data)
+        return tf.io.parse_tensor(
+            payload.data,
+            out_type=tf.dtypes.as_dtype(t.cast(str, payload.meta["dtype"])),
+        )
 
     @classmethod
     def batch_to_payloads(
@@ -348,6 +573,11 @@ class TensorflowTensorContainer(
         batch_dim: int = 0,
     ) -> t.List[Payload]:
 
+        # tf.split copies every sub-batch; when the indices cover the whole
+        # batch there is nothing to split, so payload the batch directly
+        if len(indices) == 2:
+            return [cls.to_payload(batch, batch_dim)]
+
         batches = cls.batch_to_batches(batch, indices, batch_dim)
 
         payloads = [cls.to_payload(subbatch) for subbatch in batches]
@@ -359,12 +589,30 @@ class TensorflowTensorContainer(
         payloads: t.Sequence[Payload],
         batch_dim: int = 0,
     ) -> t.Tuple["tf_ext.EagerTensor", t.List[int]]:
+        # a lone payload needs no concat, which would copy the tensor again;
+        # use the real batch dimension for the indices, payload.batch_size is
+        # -1 for transport-reconstructed payloads
+        if len(payloads) == 1:
+            batch = cls.from_payload(payloads[0])
+            return batch, [0, batch.shape[batch_dim]]
+
         batches = [cls.from_payload(payload) for payload in payloads]
-        return cls.batches_to_batch(batches, batch_dim)
+        batch: "tf_ext.EagerTensor" = tf.concat(batches, axis=batch_dim)
+        # payload.batch_size does not survive the remote transport (payloads
+        # are rebuilt there with the default -1), so the sub-batch sizes must
+        # come from the deserialized tensors themselves
+        indices: list[int] = [0]
+        indices.extend(
+            itertools.accumulate(subbatch.shape[batch_dim] for subbatch in batches)
+        )
+        return batch, indices
 
 
+# The registry matches on the exact runtime class, which for eager tensors is
+# EagerTensor, not its _EagerTensorBase base class. The key stays a LazyType so
+# that registering the container does not force the tensorflow import.
 DataContainerRegistry.register_container(
-    LazyType("tensorflow.python.framework.ops", "_EagerTensorBase"),
-    LazyType("tensorflow.python.framework.ops", "_EagerTensorBase"),
+    LazyType("tensorflow.python.framework.ops", "EagerTensor"),
+    LazyType("tensorflow.python.framework.ops", "EagerTensor"),
     TensorflowTensorContainer,
 )
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import io
+import os
+import pickle
+import shutil
+import inspect
 import typing as t
 import logging
+import threading
 import importlib
 from sys import version_info as pyver
 from typing import overload
@@ -10,16 +15,20 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 from datetime import timezone
 from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 
 import fs
 import attr
 import yaml
 import fs.errors
 import fs.mirror
+import fs.tempfs
 import cloudpickle
 from fs.base import FS
 from cattr.gen import override
+from cattr.gen import make_dict_structure_fn
 from cattr.gen import make_dict_unstructure_fn
+from cattrs.errors import ClassValidationError
 from simple_di import inject
 from simple_di import Provide
 
@@ -52,10 +61,22 @@ T = t.TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# guards the one-time framework import + runnable build in Model.to_runnable
+_to_runnable_lock = threading.Lock()
+
 PYTHON_VERSION: str = f"{pyver.major}.{pyver.minor}.{pyver.micro}"
 MODEL_YAML_FILENAME = "model.yaml"
 CUSTOM_OBJECTS_FILENAME = "custom_objects.pkl"
 
+# when PyYAML is built against libyaml, the C loader/dumper handle model.yaml
+# directly from/to the file stream several times faster than the Python ones
+_YamlSafeLoader: t.Type[yaml.SafeLoader] = getattr(
+    yaml, "CSafeLoader", yaml.SafeLoader
+)
+_YamlSafeDumper: t.Type[yaml.SafeDumper] = getattr(
+    yaml, "CSafeDumper", yaml.SafeDumper
+)
+
 
 if TYPE_CHECKING:
     ModelOptionsSuper = UserDict[str, t.Any]
@@ -63,6 +84,72 @@ else:
     ModelOptionsSuper = UserDict
 
 
+def _move_or_copy_tree(src_dir: str, dst_dir: str) -> None:
+    """Move the entries of ``src_dir`` into ``dst_dir`` with os.replace — a
+    pure rename when the temp dir and the store share a filesystem — falling
+    back to a copy for entries that cross a device boundary."""
+    # snapshot the entries before renaming them out from under the iterator;
+    # scandir also gives us the dir/file distinction without an extra stat in
+    # the cross-device fallback
+    for entry in list(os.scandir(src_dir)):
+        dst = os.path.join(dst_dir, entry.name)
+        try:
+            os.replace(entry.path, dst)
+        except OSError:
+            if entry.is_dir():
+                _copy_tree(entry.path, dst)
+            else:
+                shutil.copy2(entry.path, dst)
+
+
+def _copy_tree(src_dir: str, dst_dir: str) -> None:
+    """Copy a directory tree between real filesystem paths. shutil.copy2 goes
+    through os.sendfile/copy_file_range on platforms that support it, avoiding
+    the Python-level read/write loops that fs.mirror uses. Files are copied
+    concurrently; model directories often hold many artifacts (sharded
+    weights, tokenizers, configs) and a single sequential copy cannot
+    saturate NVMe bandwidth."""
+    os.makedirs(dst_dir, exist_ok=True)
+    file_pairs: list[tuple[str, str]] = []
+    # create the directory structure first so copies can run in any order
+    for root, dirs, files in os.walk(src_dir):
+        rel = os.path.relpath(root, src_dir)
+        target = dst_dir if rel == os.curdir else os.path.join(dst_dir, rel)
+        for name in dirs:
+            os.makedirs(os.path.join(target, name), exist_ok=True)
+        for name in files:
+            file_pairs.append((os.path.join(root, name), os.path.join(target, name)))
+
+    if len(file_pairs) <= 1:
+        for src, dst in file_pairs:
+            shutil.copy2(src, dst)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1, len(file_pairs))
+    ) as executor:
+        # consume the iterator so the first copy failure propagates
+        for _ in executor.map(lambda pair: shutil.copy2(*pair), file_pairs):
+            pass
+
+
+class _ImportablePickler(pickle.Pickler):
+    """A stdlib pickler that refuses functions and classes the serving
+    process could not re-import. pickle serializes them by reference without
+    complaint — a preprocessor defined in the user's training script lives in
+    ``__main__`` and only fails at load time — so they must go through the
+    cloudpickle fallback, which serializes by value."""
+
+    def reducer_override(self, obj: t.Any) -> t.Any:
+        if (inspect.isfunction(obj) or inspect.isclass(obj)) and getattr(
+            obj, "__module__", None
+        ) in (None, "__main__"):
+            raise pickle.PicklingError(
+                f"{obj!r} is only importable from __main__; deferring to cloudpickle"
+            )
+        return NotImplemented
+
+
 class ModelOptions(ModelOptionsSuper):
     @classmethod
     def with_options(cls, **kwargs: t.Any) -> ModelOptions:
@@ -124,15 +211,18 @@ class Model(StoreItem):
     @property
     def custom_objects(self) -> t.Dict[str, t.Any]:
         if self._custom_objects is None:
-            if self._fs.isfile(CUSTOM_OBJECTS_FILENAME):
-                with self._fs.open(CUSTOM_OBJECTS_FILENAME, "rb") as cofile:
-                    self._custom_objects: dict[str, t.Any] | None = cloudpickle.load(
-                        cofile
-                    )
-                    if not isinstance(self._custom_objects, dict):
-                        raise ValueError("Invalid custom objects found.")
-            else:
+            try:
+                # fetch the blob in one FS dispatch instead of a stat plus a
+                # streamed read, then unpickle from memory
+                data = self._fs.readbytes(CUSTOM_OBJECTS_FILENAME)
+            except fs.errors.ResourceNotFound:
                 self._custom_objects: dict[str, t.Any] | None = {}
+            else:
+                # cloudpickle emits standard pickle streams, so the
+                # C-accelerated stdlib unpickler handles both writers
+                self._custom_objects: dict[str, t.Any] | None = pickle.loads(data)
+                if not isinstance(self._custom_objects, dict):
+                    raise ValueError("Invalid custom objects found.")
 
         return self._custom_objects
 
@@ -219,7 +309,22 @@ class Model(StoreItem):
 
         with model_store.register(self.tag) as model_path:
             out_fs = fs.open_fs(model_path, create=True, writeable=True)
-            fs.mirror.mirror(self._fs, out_fs, copy_if_newer=False)
+            try:
+                src_path = self._fs.getsyspath("/")
+                dst_path = out_fs.getsyspath("/")
+            except fs.errors.NoSysPath:
+                # e.g. models opened from a tar archive; stream through pyfs
+                fs.mirror.mirror(self._fs, out_fs, copy_if_newer=False)
+            else:
+                if isinstance(self._fs, fs.tempfs.TempFS):
+                    # the ephemeral temp dir made by Model.create is a real
+                    # directory, so its contents can usually be renamed
+                    # straight into the store instead of copied
+                    _move_or_copy_tree(src_path, dst_path)
+                else:
+                    # store-backed models (copy_model, bento builds) must
+                    # leave their source directory intact
+                    _copy_tree(src_path, dst_path)
             self._fs.close()
             self.__fs = out_fs
 
@@ -260,10 +365,22 @@ class Model(StoreItem):
             self.info.dump(t.cast(io.StringIO, model_yaml))
 
     def _write_custom_objects(self):
-        # pickle custom_objects if it is not None and not empty
-        if self.custom_objects:
-            with self._fs.open(CUSTOM_OBJECTS_FILENAME, "wb") as cofile:
-                cloudpickle.dump(self.custom_objects, cofile)  # type: ignore (incomplete cloudpickle types)
+        # pickle custom_objects if it is not None and not empty; check the
+        # in-memory field instead of the custom_objects property, which would
+        # unpickle the whole file from disk just to find nothing new to write
+        if self._custom_objects:
+            try:
+                buf = io.BytesIO()
+                _ImportablePickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(
+                    self._custom_objects
+                )
+                data = buf.getvalue()
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # cloudpickle is much slower but serializes by value the
+                # objects the stdlib pickler cannot ship: lambdas, locally
+                # defined classes, and anything living in __main__
+                data = cloudpickle.dumps(self._custom_objects)  # type: ignore (incomplete cloudpickle types)
+            self._fs.writebytes(CUSTOM_OBJECTS_FILENAME, data)
 
     @property
     def creation_time(self) -> datetime:
@@ -313,9 +430,13 @@ class Model(StoreItem):
         )
 
     def to_runnable(self) -> t.Type[Runnable]:
+        # double-checked locking: the framework import and runnable class build
+        # are expensive and must happen once even under concurrent callers
         if self._runnable is None:
-            module = importlib.import_module(self.info.module)
-            self._runnable = module.get_runnable(self)
+            with _to_runnable_lock:
+                if self._runnable is None:
+                    module = importlib.import_module(self.info.module)
+                    self._runnable = module.get_runnable(self)
         return self._runnable
 
     def with_options(self, **kwargs: t.Any) -> Model:
@@ -330,6 +451,8 @@ class Model(StoreItem):
 
 
 class ModelStore(Store[Model]):
+    __slots__ = ()
+
     def __init__(self, base_path: "t.Union[PathType, FS]"):
         super().__init__(base_path, Model)
 
@@ -351,8 +474,11 @@ class ModelContext:
         return bentoml_cattr.unstructure(self)  # type: ignore (incomplete cattr types)
 
 
-# Remove after attrs support ForwardRef natively
-attr.resolve_types(ModelContext, globals(), locals())
+# pre-compiled structure hook; generating it also resolves the class's string
+# annotations, which previously needed an explicit attr.resolve_types call
+bentoml_cattr.register_structure_hook(
+    ModelContext, make_dict_structure_fn(ModelContext, bentoml_cattr)
+)
 
 
 @attr.frozen
@@ -420,11 +546,17 @@ class ModelSignature:
 
     @staticmethod
     def from_dict(data: ModelSignatureDict) -> ModelSignature:
-        if "batch_dim" in data and isinstance(data["batch_dim"], int):
-            formated_data = dict(data, batch_dim=(data["batch_dim"], data["batch_dim"]))
-        else:
-            formated_data = data
-        return bentoml_cattr.structure(formated_data, ModelSignature)
+        # a signature dict has only four known keys, so building the attrs
+        # class directly skips a converter dispatch per signature
+        batch_dim = data.get("batch_dim", (0, 0))
+        if isinstance(batch_dim, int):
+            batch_dim = (batch_dim, batch_dim)
+        return ModelSignature(
+            batchable=data.get("batchable", False),
+            batch_dim=t.cast("tuple[int, int]", tuple(batch_dim)),
+            input_spec=data.get("input_spec"),
+            output_spec=data.get("output_spec"),
+        )
 
     @staticmethod
     def convert_signatures_dict(
@@ -436,8 +568,11 @@ class ModelSignature:
         }
 
 
-# Remove after attrs support ForwardRef natively
-attr.resolve_types(ModelSignature, globals(), locals())
+# pre-compiled structure hook; the plain Converter otherwise re-inspects the
+# attrs fields on every ModelSignature.from_dict call
+bentoml_cattr.register_structure_hook(
+    ModelSignature, make_dict_structure_fn(ModelSignature, bentoml_cattr)
+)
 
 
 if TYPE_CHECKING:
@@ -482,6 +617,15 @@ class ModelInfo:
     api_version: str
     creation_time: datetime
 
+    # cached result of bentoml_cattr.unstructure(self); ModelInfo is frozen, so
+    # the unstructured form only changes when parse_options swaps the options
+    _cached_dict: t.Optional[t.Dict[str, t.Any]] = attr.field(
+        init=False, default=None
+    )
+    # cached YAML node built by _ModelInfo_dumper, invalidated alongside
+    # _cached_dict
+    _cached_node: t.Optional["yaml.Node"] = attr.field(init=False, default=None)
+
     def __init__(
         self,
         tag: Tag,
@@ -510,20 +654,24 @@ class ModelInfo:
         self.validate()
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ModelInfo):
             return False
 
+        # cheap scalar fields first so mismatches bail before the dict
+        # comparisons; signatures used to be compared twice here
         return (
             self.tag == other.tag
             and self.module == other.module
+            and self.api_version == other.api_version
+            and self.creation_time == other.creation_time
             and self.signatures == other.signatures
             and self.labels == other.labels
             and self.options == other.options
             and self.metadata == other.metadata
             and self.context == other.context
-            and self.signatures == other.signatures
-            and self.api_version == other.api_version
-            and self.creation_time == other.creation_time
         )
 
     def with_options(self, **kwargs: t.Any) -> ModelInfo:
@@ -540,10 +688,16 @@ class ModelInfo:
         )
 
     def to_dict(self) -> t.Dict[str, t.Any]:
-        return bentoml_cattr.unstructure(self)  # type: ignore (incomplete cattr types)
+        if self._cached_dict is None:
+            object.__setattr__(
+                self, "_cached_dict", bentoml_cattr.unstructure(self)  # type: ignore (incomplete cattr types)
+            )
+        return t.cast(t.Dict[str, t.Any], self._cached_dict)
 
     def parse_options(self, options_class: type[ModelOptions]) -> None:
         object.__setattr__(self, "options", options_class.with_options(**self.options))
+        object.__setattr__(self, "_cached_dict", None)
+        object.__setattr__(self, "_cached_node", None)
 
     @overload
     def dump(self, stream: io.StringIO) -> io.BytesIO:
@@ -554,12 +708,12 @@ class ModelInfo:
         ...
 
     def dump(self, stream: io.StringIO | None = None) -> io.BytesIO | None:
-        return yaml.safe_dump(self.to_dict(), stream=stream, sort_keys=False)  # type: ignore (bad yaml types)
+        return yaml.dump(self.to_dict(), stream=stream, sort_keys=False, Dumper=_YamlSafeDumper)  # type: ignore (bad yaml types)
 
     @staticmethod
     def from_yaml_file(stream: t.IO[t.Any]):
         try:
-            yaml_content = yaml.safe_load(stream)
+            yaml_content = yaml.load(stream, Loader=_YamlSafeLoader)
         except yaml.YAMLError as exc:  # pragma: no cover - simple error handling
             logger.error(exc)
             raise
@@ -567,27 +721,24 @@ class ModelInfo:
         if not isinstance(yaml_content, dict):
             raise BentoMLException(f"malformed {MODEL_YAML_FILENAME}")
 
-        yaml_content["tag"] = str(
-            Tag(
-                t.cast(str, yaml_content["name"]),
-                t.cast(str, yaml_content["version"]),
-            )
-        )
-        del yaml_content["name"]
-        del yaml_content["version"]
+        # name and version were validated when the model was created; join
+        # them directly and let the converter build the Tag object once.
+        # The compiled structure hook only reads ModelInfo fields, so legacy
+        # keys (name/version once folded into the tag, top-level
+        # bentoml_version, context.pip_dependencies) are skipped without
+        # having to delete them from the parsed dict first.
+        yaml_content["tag"] = f'{yaml_content["name"]}:{yaml_content["version"]}'
 
         # For backwards compatibility for bentos created prior to version 1.0.0rc1
-        if "bentoml_version" in yaml_content:
-            del yaml_content["bentoml_version"]
         if "signatures" not in yaml_content:
             yaml_content["signatures"] = {}
-        if "context" in yaml_content and "pip_dependencies" in yaml_content["context"]:
-            del yaml_content["context"]["pip_dependencies"]
-            yaml_content["context"]["framework_versions"] = {}
+        context = yaml_content.get("context")
+        if context is not None and "pip_dependencies" in context:
+            context["framework_versions"] = {}
 
         try:
             model_info = bentoml_cattr.structure(yaml_content, ModelInfo)
-        except TypeError as e:  # pragma: no cover - simple error handling
+        except (TypeError, ClassValidationError) as e:  # pragma: no cover - simple error handling
             raise BentoMLException(f"unexpected field in {MODEL_YAML_FILENAME}: {e}")
         return model_info
 
@@ -597,13 +748,30 @@ class ModelInfo:
         ...
 
 
-# Remove after attrs support ForwardRef natively
-attr.resolve_types(ModelInfo, globals(), locals())
+# pre-compiled structure hook; name and version are folded into the tag by
+# from_yaml_file before structuring, so they are omitted here
+bentoml_cattr.register_structure_hook(
+    ModelInfo,
+    make_dict_structure_fn(
+        ModelInfo,
+        bentoml_cattr,
+        name=override(omit=True),
+        version=override(omit=True),
+        _cached_dict=override(omit=True),
+        _cached_node=override(omit=True),
+    ),
+)
 
 bentoml_cattr.register_unstructure_hook_func(
     lambda cls: issubclass(cls, ModelInfo),
     # Ignore tag, tag is saved via the name and version field
-    make_dict_unstructure_fn(ModelInfo, bentoml_cattr, tag=override(omit=True)),  # type: ignore (incomplete types)
+    make_dict_unstructure_fn(
+        ModelInfo,
+        bentoml_cattr,
+        tag=override(omit=True),
+        _cached_dict=override(omit=True),
+        _cached_node=override(omit=True),
+    ),  # type: ignore (incomplete types)
 )
 
 
@@ -627,7 +795,14 @@ def copy_model(
 
 
 def _ModelInfo_dumper(dumper: yaml.Dumper, info: ModelInfo) -> yaml.Node:
-    return dumper.represent_dict(info.to_dict())
+    # ModelInfo is frozen, so its YAML node only changes when parse_options
+    # swaps the options class; cache it per instance so bento manifests
+    # holding many models build each node once
+    if info._cached_node is None:
+        object.__setattr__(
+            info, "_cached_node", dumper.represent_dict(info.to_dict())
+        )
+    return t.cast(yaml.Node, info._cached_node)
 
 
 yaml.add_representer(ModelInfo, _ModelInfo_dumper)  # type: ignore (incomplete yaml types)
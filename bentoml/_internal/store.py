@@ -6,6 +6,7 @@ import datetime
 from abc import ABC
 from abc import abstractmethod
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import fs
 import fs.errors
@@ -21,6 +22,8 @@ T = t.TypeVar("T")
 
 
 class StoreItem(Exportable):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tag(self) -> Tag:
@@ -58,6 +61,8 @@ class Store(ABC, t.Generic[Item]):
 
     """
 
+    __slots__ = ("_fs", "_item_type")
+
     _fs: FS
     _item_type: t.Type[Item]
 
@@ -70,12 +75,20 @@ class Store(ABC, t.Generic[Item]):
 
     def list(self, tag: t.Optional[t.Union[Tag, str]] = None) -> t.List[Item]:
         if not tag:
-            return [
-                ver
-                for _d in sorted(self._fs.listdir("/"))
-                if self._fs.isdir(_d)
-                for ver in self.list(_d)
-            ]
+            # one scandir pass instead of listdir + an isdir stat per entry
+            names = sorted(d.name for d in self._fs.scandir("/") if d.is_dir)
+            if len(names) <= 1:
+                return [ver for _d in names for ver in self.list(_d)]
+
+            # listing an item is a handful of tiny independent metadata reads;
+            # overlap them across items so enumerating a cold store is not
+            # bound by sequential syscall latency
+            with ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1, len(names))
+            ) as executor:
+                return [
+                    ver for vers in executor.map(self.list, names) for ver in vers
+                ]
 
         _tag = Tag.from_taglike(tag)
         if _tag.version is None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import errno
 from sys import version_info as pyver
 from typing import TYPE_CHECKING
 from datetime import datetime
@@ -18,6 +19,7 @@ from bentoml._internal.models import ModelOptions
 from bentoml._internal.models.model import Model
 from bentoml._internal.models.model import ModelInfo
 from bentoml._internal.models.model import ModelStore
+from bentoml._internal.models.model import copy_model
 from bentoml._internal.configuration import BENTOML_VERSION
 
 if TYPE_CHECKING:
@@ -259,6 +261,92 @@ def test_model_export_import(bento_model, tmpdir: "Path"):
     assert from_fs_model_str == f'Model(tag="{bento_model.tag}", path="{save_path}")'
 
 
+def test_model_save_copy_fallback(bento_model, tmpdir: "Path", monkeypatch):
+    # when the temp dir and the store live on different filesystems,
+    # os.replace fails with EXDEV and _save must fall back to copying the
+    # tree instead of renaming it
+    def raise_exdev(src: str, dst: str):
+        raise OSError(errno.EXDEV, "cross-device link", src)
+
+    monkeypatch.setattr(os, "replace", raise_exdev)
+
+    extra_path = bento_model.path_of("subdir/weights.bin")
+    os.makedirs(os.path.dirname(extra_path))
+    with open(extra_path, "wb") as f:
+        f.write(b"weights")
+
+    model_store = ModelStore(tmpdir)
+    bento_model.save(model_store)
+
+    reloaded = model_store.get(bento_model.tag)
+    assert reloaded.info == bento_model.info
+    assert reloaded.custom_objects["add"](3) == add_num_1 + 3
+    with open(reloaded.path_of("subdir/weights.bin"), "rb") as f:
+        assert f.read() == b"weights"
+
+
+def test_custom_objects_defined_in_main():
+    # objects defined in the user's training script live in __main__ and can
+    # only be resolved there, so they must be serialized by value; stdlib
+    # pickle would happily store them by reference and fail in the serving
+    # process
+    import sys
+    import types
+    import pickle
+
+    def _impl(x: int) -> int:
+        return x + 1
+
+    fn = types.FunctionType(_impl.__code__, {}, "preprocess")
+    fn.__module__ = "__main__"
+    fn.__qualname__ = "preprocess"
+
+    main_module = sys.modules["__main__"]
+    setattr(main_module, "preprocess", fn)
+    try:
+        model = Model.create(
+            "mainobjmodel",
+            module="test",
+            api_version="v1",
+            signatures={},
+            context=TEST_MODEL_CONTEXT,
+            custom_objects={"preprocess": fn},
+        )
+        model.flush()
+        with open(model.path_of("custom_objects.pkl"), "rb") as f:
+            data = f.read()
+    finally:
+        delattr(main_module, "preprocess")
+
+    # with the attribute gone, loading only works if it was stored by value
+    restored = pickle.loads(data)
+    assert restored["preprocess"](1) == 2
+
+
+def test_copy_model_leaves_source_intact(bento_model, tmpdir: "Path"):
+    # the rename fast path must only apply to the temp dir made by
+    # Model.create; copying between stores has to leave the source alone
+    src_path = os.path.join(tmpdir, "src")
+    target_path = os.path.join(tmpdir, "target")
+    os.makedirs(src_path)
+    os.makedirs(target_path)
+    src_store = ModelStore(src_path)
+    target_store = ModelStore(target_path)
+    bento_model.save(src_store)
+
+    copy_model(
+        bento_model.tag,
+        src_model_store=src_store,
+        target_model_store=target_store,
+    )
+
+    src_model = src_store.get(bento_model.tag)
+    target_model = target_store.get(bento_model.tag)
+    assert src_model.info == target_model.info
+    assert src_model.custom_objects["add"](3) == add_num_1 + 3
+    assert target_model.custom_objects["add"](3) == add_num_1 + 3
+
+
 def test_load_bad_model(tmpdir: "Path"):
     with pytest.raises(BentoMLException):
         Model.from_fs(fs.open_fs(os.path.join(tmpdir, "nonexistent"), create=True))
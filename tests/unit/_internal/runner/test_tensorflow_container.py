@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+import bentoml._internal.frameworks.tensorflow_v2 as tf_v2
+from bentoml._internal.runner.container import Payload
+from bentoml._internal.runner.container import AutoContainer
+from bentoml._internal.runner.container import DataContainerRegistry
+
+TensorflowTensorContainer = tf_v2.TensorflowTensorContainer
+
+
+def strip_batch_size(payload: Payload) -> Payload:
+    # the remote runner transport only carries data, meta and container;
+    # batch_size comes back with its default of -1 on the receiving side
+    return Payload(payload.data, payload.meta, payload.container)
+
+
+def test_autocontainer_routes_eager_tensor():
+    tensor = tf.constant([[1.0, 2.0]])
+    assert (
+        DataContainerRegistry.find_by_batch_type(type(tensor))
+        is TensorflowTensorContainer
+    )
+
+    payload = AutoContainer.to_payload(tensor, batch_dim=0)
+    assert payload.container == TensorflowTensorContainer.__name__
+    restored = AutoContainer.from_payload(payload)
+    assert (restored.numpy() == tensor.numpy()).all()
+
+
+@pytest.mark.parametrize(
+    "tensor",
+    [
+        tf.constant([[1.0, 2.0], [3.0, 4.0]]),
+        tf.constant([[1, 2], [3, 4]], dtype=tf.int64),
+        tf.constant([["a", "b"], ["c", "d"]]),
+    ],
+)
+def test_serialize_tensor_payload_roundtrip(tensor):
+    payload = TensorflowTensorContainer.to_payload(tensor)
+    assert payload.meta["format"] == "serialize_tensor"
+    assert payload.batch_size == 2
+
+    restored = TensorflowTensorContainer.from_payload(strip_batch_size(payload))
+    assert restored.dtype == tensor.dtype
+    assert (restored.numpy() == tensor.numpy()).all()
+
+
+def test_ragged_tensor_payload_roundtrip():
+    ragged = tf.ragged.constant([[1, 2], [3], [4, 5, 6]])
+    payload = TensorflowTensorContainer.to_payload(ragged)
+    assert payload.meta["format"] == "pickle"
+    assert payload.batch_size == 3
+
+    restored = TensorflowTensorContainer.from_payload(strip_batch_size(payload))
+    assert isinstance(restored, tf.RaggedTensor)
+    assert restored.to_list() == ragged.to_list()
+
+
+def test_shm_payload_roundtrip(monkeypatch):
+    monkeypatch.setattr(tf_v2, "_SHM_PAYLOAD_ENABLED", True)
+
+    tensor = tf.constant([[1.0, 2.0], [3.0, 4.0]])
+    payload = TensorflowTensorContainer.to_payload(tensor)
+    assert payload.meta["format"] == "shm"
+
+    restored = TensorflowTensorContainer.from_payload(strip_batch_size(payload))
+    assert restored.dtype == tensor.dtype
+    assert (restored.numpy() == tensor.numpy()).all()
+
+    # string tensors have no flat numeric buffer and must fall back to
+    # serialize_tensor instead of attempting the DLPack export
+    text = tf.constant([["a"], ["b"]])
+    text_payload = TensorflowTensorContainer.to_payload(text)
+    assert text_payload.meta["format"] == "serialize_tensor"
+    restored_text = TensorflowTensorContainer.from_payload(text_payload)
+    assert (restored_text.numpy() == text.numpy()).all()
+
+
+@pytest.mark.parametrize("batch_dim", [0, 1])
+def test_batch_payloads_roundtrip(batch_dim):
+    if batch_dim == 0:
+        batches = [tf.ones((2, 3)), tf.zeros((3, 3))]
+    else:
+        batches = [tf.ones((3, 2)), tf.zeros((3, 3))]
+
+    batch, indices = TensorflowTensorContainer.batches_to_batch(
+        batches, batch_dim=batch_dim
+    )
+    assert indices == [0, 2, 5]
+
+    payloads = TensorflowTensorContainer.batch_to_payloads(
+        batch, indices, batch_dim=batch_dim
+    )
+    # simulate the remote transport dropping batch_size
+    payloads = [strip_batch_size(p) for p in payloads]
+
+    restored_batch, restored_indices = TensorflowTensorContainer.from_batch_payloads(
+        payloads, batch_dim=batch_dim
+    )
+    assert restored_indices == indices
+    assert (restored_batch.numpy() == batch.numpy()).all()
+
+    restored = TensorflowTensorContainer.batch_to_batches(
+        restored_batch, restored_indices, batch_dim=batch_dim
+    )
+    for original, roundtripped in zip(batches, restored):
+        assert (original.numpy() == roundtripped.numpy()).all()
+
+
+def test_single_payload_roundtrip_indices():
+    batch = tf.ones((4, 2))
+    payloads = TensorflowTensorContainer.batch_to_payloads(batch, [0, 4])
+    assert len(payloads) == 1
+
+    restored_batch, indices = TensorflowTensorContainer.from_batch_payloads(
+        [strip_batch_size(payloads[0])]
+    )
+    assert indices == [0, 4]
+    assert (restored_batch.numpy() == batch.numpy()).all()